@@ -3,13 +3,34 @@ import tkinter as tk # Needed for standard widgets (Listbox)
 from tkinter import messagebox, ttk # ttk needed for Treeview
 import json
 import os
-from datetime import datetime
+import queue
+import re
+import sqlite3
+import threading
+import traceback
+import functools
+import heapq
+from datetime import date
 import uuid
-from collections import defaultdict
+from collections import Counter, defaultdict
+from operator import itemgetter
+
+try:
+    import orjson # Optional C-accelerated JSON parser/serializer
+except ImportError:
+    orjson = None
 
 # --- Configuration ---
-EXPENSES_FILE = "expenses.json"
+EXPENSES_DB = "expenses.db" # SQLite database holding all transactions
+EXPENSES_FILE = "expenses.json" # Pre-SQLite storage, imported into EXPENSES_DB once
+TREE_ROW_HEIGHT = 20 # Approximate Treeview row height in pixels
+RENDER_BUFFER = 20 # Extra rows rendered beyond the visible window
+LOAD_POLL_MS = 20 # How often the Tk thread checks whether the background load is done
+WRITE_POLL_MS = 100 # How often the Tk thread checks for save results while writes are outstanding
+BREAKDOWN_TOP_N = 10 # Largest categories listed individually in the breakdown
+FSYNC_SAVES = os.environ.get("EXPENSE_TRACKER_FSYNC") == "1" # Opt-in power-loss durability (SQLite synchronous=FULL)
 CATEGORIES_FILE = "categories.json"
+DATE_PATTERN = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}") # Zero-padded YYYY-MM-DD; legacy dates are normalised to it on import
 DEFAULT_CATEGORIES = ["Food", "Transport", "Entertainment", "Shopping", "Bills", "Healthcare", "Other"]
 
 # CustomTkinter Appearance Settings
@@ -17,6 +38,171 @@ ctk.set_appearance_mode("Dark")  # Sleek dark theme
 ctk.set_default_color_theme("blue") # Dark blue/purple primary color
 # ---------------------
 
+def _parse_json(raw):
+    """Parse a JSON document (str or bytes), using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _read_json(path):
+    """Parse a JSON file, using orjson when it is installed."""
+    # Binary: both parsers take UTF-8 bytes, whatever the locale encoding.
+    # Unbuffered: read() then sizes one read from fstat, with no copy through a buffer.
+    with open(path, 'rb', buffering=0) as f:
+        return _parse_json(f.read())
+
+def _dump_json(data):
+    """Serialize to compact UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode()
+
+def _sync_if_enabled(f):
+    """Force a written file's data to disk when FSYNC_SAVES is on."""
+    if FSYNC_SAVES:
+        f.flush()
+        getattr(os, 'fdatasync', os.fsync)(f.fileno()) # fdatasync is POSIX-only
+
+def _atomic_write(path, data):
+    """Write bytes via a temp file + os.replace so a crash never leaves a half-written file."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        _sync_if_enabled(f)
+    os.replace(tmp_path, path)
+
+# Column order of the tx table; rows load in the order they were saved and are sorted by day in Python
+_TX_COLUMNS = ("id", "type", "cents", "category", "description", "date")
+_TX_TABLE = """
+CREATE TABLE IF NOT EXISTS tx (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    cents INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    description TEXT NOT NULL,
+    date TEXT NOT NULL
+)"""
+SCHEMA_VERSION = 1 # Stored in PRAGMA user_version; 0 means the legacy JSON import hasn't run yet
+_TX_SELECT = "SELECT id, type, cents, category, description, date FROM tx ORDER BY rowid"
+_TX_UPSERT = "INSERT OR REPLACE INTO tx VALUES (?, ?, ?, ?, ?, ?)" # Replacing moves an edit to the end of its day, as in memory
+_TX_DELETE = "DELETE FROM tx WHERE id = ?"
+
+def _connect():
+    """Open EXPENSES_DB, creating its schema on first use."""
+    conn = sqlite3.connect(EXPENSES_DB)
+    conn.execute("PRAGMA journal_mode=WAL") # Appends to a log instead of rewriting pages in place
+    conn.execute(f"PRAGMA synchronous={'FULL' if FSYNC_SAVES else 'NORMAL'}")
+    conn.execute(_TX_TABLE)
+    return conn
+
+def _to_cents(amount):
+    """Convert a dollar amount (float or numeric string) to integer cents (ValueError if out of range)."""
+    cents = round(float(amount) * 100)
+    if not -2**63 <= cents < 2**63: # SQLite INTEGER is a signed 64-bit value
+        raise ValueError(f"amount out of range: {amount}")
+    return cents
+
+def _format_cents(cents):
+    """Format integer cents like f"${dollars:,.2f}" (e.g. $1,234.50, $-3.00), without float math."""
+    dollars, cents_part = divmod(abs(cents), 100)
+    return f"${'-' if cents < 0 else ''}{dollars:,}.{cents_part:02d}"
+
+def _tx_row(expense):
+    """A transaction's values in _TX_COLUMNS order, for the tx table."""
+    return tuple(expense[col] for col in _TX_COLUMNS)
+
+def _normalize_date(date_str):
+    """Zero-pad a Y-M-D date (the old strptime check accepted e.g. 2024-1-5); unparseable strings are kept as-is."""
+    try:
+        return date(*map(int, date_str.split('-'))).isoformat()
+    except (ValueError, TypeError): # Not numbers, not a real date, or not three parts
+        return date_str
+
+def _load_legacy_expenses():
+    """
+    Read transactions from the pre-SQLite JSON file, raising ValueError if it is
+    unparseable. Entries are ensured to have a unique ID and a 'type' key, which
+    handles migration for old files that lack them.
+    """
+    if not os.path.exists(EXPENSES_FILE):
+        return []
+    try:
+        data = _read_json(EXPENSES_FILE)
+    except ValueError as exc:
+        # Raised so the import is rolled back and retried next start, not marked done
+        raise ValueError(f"Could not import {EXPENSES_FILE}: {exc}") from exc
+    
+    for exp in data:
+        # 1. Ensure unique ID
+        if 'id' not in exp:
+            exp['id'] = str(uuid.uuid4())
+        # 2. Add 'type' key for old entries (Migration fix)
+        exp.setdefault('type', 'Expense')
+        # 3. Float dollars to integer cents
+        try:
+            exp['cents'] = _to_cents(exp.pop('amount'))
+        except (ValueError, OverflowError) as exc: # Reported by the loader; the import is retried next start
+            raise ValueError(f"Could not import {EXPENSES_FILE}: {exc}") from exc
+        # 4. Zero-padded dates, so they sort, bisect and validate like new ones
+        exp['date'] = _normalize_date(exp['date'])
+    return data
+
+@functools.lru_cache(maxsize=512)
+def _is_valid_date(date_str):
+    """True if date_str is a real calendar date in YYYY-MM-DD form (cheaper than strptime)."""
+    # fromisoformat also accepts other ISO forms (e.g. 20240101), hence the pattern check
+    if not DATE_PATTERN.fullmatch(date_str):
+        return False
+    try:
+        date.fromisoformat(date_str)
+    except ValueError:
+        return False
+    return True
+
+@functools.lru_cache(maxsize=None)
+def _display_category(category):
+    """Display form of a stored (lowercase) category name; the set of names is small."""
+    return category.capitalize()
+
+@functools.lru_cache(maxsize=4096)
+def _day_number(date_str):
+    """Proleptic ordinal of a YYYY-MM-DD date, as a cheap int sort key (0 if unparseable)."""
+    try:
+        return date.fromisoformat(date_str).toordinal()
+    except ValueError:
+        return 0 # Hand-edited garbage sorts as oldest
+
+def _add_display_fields(expense):
+    """Cache the Treeview row values and date sort key of a transaction; '_' keys are never saved."""
+    expense['_day'] = _day_number(expense['date'])
+    expense['_row'] = (
+        expense['type'],
+        expense['date'],
+        _format_cents(expense['cents']),
+        _display_category(expense['category']),
+        expense['description']
+    )
+
+def _insert_position(seq, day):
+    """Index at which an entry with day number `day` belongs in `seq` (sorted newest first), after same-day entries."""
+    lo, hi = 0, len(seq)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if seq[mid]['_day'] >= day:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+def _index_of(seq, entry):
+    """Index of `entry` (by identity) in `seq` (sorted newest first), searching only its date's run."""
+    i = _insert_position(seq, entry['_day']) - 1
+    while i >= 0 and seq[i]['_day'] == entry['_day']:
+        if seq[i] is entry:
+            return i
+        i -= 1
+    raise ValueError("entry not in sequence")
+
 class FinancialTracker(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -27,67 +213,198 @@ class FinancialTracker(ctk.CTk):
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(2, weight=1) # The List Frame gets expansion space
         
-        self.expenses = self.load_expenses()
+        # Database writes run on a background thread so saving never blocks the UI
+        self._write_q = queue.Queue()
+        self._write_results = queue.Queue() # (changes applied or dropped, exception or None) per batch
+        self._writes_pending = 0 # Changes queued whose result the Tk thread hasn't seen yet
+        self._write_poll_pending = False
+        threading.Thread(target=self._run_writer, daemon=True).start()
+        
+        self._sorted_view = [] # Filtered, newest-first list backing the Treeview
+        self._rendered_count = 0 # How many rows of _sorted_view are inserted in the Treeview
+        self._render_pending = False
+        self._detached = set() # IDs of rows hidden by a filter, kept for reattaching
+        self._summary_pending = False # Stat box update scheduled for when Tk is idle
+        self._category_filter = None # Active filters, set by filter_expenses
+        self._type_filter = None
+        self._set_expenses([]) # Filled in by _finish_load once the background load is done
         self.categories = self.load_categories()
+        self._set_display_categories()
+        self._recompute_totals()
         
         # Modern fonts
         self.font_main = ctk.CTkFont(family="Segoe UI", size=18, weight="bold")
         self.font_label = ctk.CTkFont(family="Segoe UI", size=12)
         self.font_stat = ctk.CTkFont(family="Segoe UI", size=24, weight="bold")
+        self.font_dot = ctk.CTkFont(size=30)
+        self.font_small = ctk.CTkFont(family="Segoe UI", size=10)
         
         self.create_widgets()
-        self.refresh_expense_list()
         self.update_summary()
+        
+        # Paint the window first; the database is read on a worker thread meanwhile
+        self.tree.insert("", ctk.END, iid="loading", values=("", "", "", "", "Loading…"))
+        self.tree.configure(selectmode="none") # The placeholder row can't be edited or deleted
+        self._load_q = queue.Queue()
+        threading.Thread(target=self._load_in_background, daemon=True).start()
+        self.after_idle(self._poll_load)
+        
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
     
     # --- Data Persistence Methods ---
+    def _load_in_background(self):
+        """Loader thread: read, prepare and sort the transactions, then hand them to the Tk thread."""
+        try:
+            expenses = self.load_expenses()
+            for exp in expenses:
+                _add_display_fields(exp)
+            expenses.sort(key=itemgetter('_day'), reverse=True) # Stable, so same-day rows stay in save order
+        except Exception as exc:
+            traceback.print_exc()
+            self._load_q.put(exc) # Reported to the user on the Tk thread
+            return
+        self._load_q.put(expenses)
+
+    def _poll_load(self):
+        """Pick up the background load's result; Tk may only be touched from this thread."""
+        try:
+            result = self._load_q.get_nowait()
+        except queue.Empty:
+            self.after(LOAD_POLL_MS, self._poll_load)
+            return
+        if isinstance(result, Exception):
+            messagebox.showerror("Load Failed", f"Your transactions could not be loaded:\n{result}\n\n"
+                                                "The list starts empty; fix the problem and restart to see them.")
+            result = [] # Still enable the app, rather than leave it on the loading row
+        self._finish_load(result)
+
+    def _finish_load(self, expenses):
+        """Install the loaded transactions, then fill the Treeview and summary and enable the controls."""
+        self._set_expenses(expenses)
+        self._recompute_totals()
+        self.update_summary()
+        
+        self.tree.delete("loading")
+        self.tree.configure(selectmode="extended")
+        self.filter_expenses(None)
+        for widget in (self.add_btn, self.delete_btn, self.manage_btn, self.filter_category_combo, self.filter_type_combo):
+            widget.configure(state="normal")
+
+    def _set_expenses(self, expenses):
+        """Use `expenses` (sorted newest-first) as the transaction list and index it."""
+        self.expenses = expenses # Kept newest-first from here on
+        self._by_id = {exp['id']: exp for exp in expenses} # O(1) lookup for edit/delete
+        self._by_category = defaultdict(list) # Newest-first subsets of self.expenses, for filtering
+        self._by_type = defaultdict(list)
+        for exp in expenses:
+            self._by_category[exp['category']].append(exp)
+            self._by_type[exp['type']].append(exp)
+
     def load_expenses(self):
         """
-        Load expenses from file, ensuring each has a unique ID and a 'type' key.
-        This handles migration for old files that lack the 'id' or 'type' key.
+        Load all transactions from the SQLite database, newest first. On the first
+        run with a new database, transactions from the old JSON file are
+        imported in the same transaction that marks the import as done. Amounts are
+        integer cents (the 'cents' key), so totals are exact.
         """
-        data = []
-        if os.path.exists(EXPENSES_FILE):
-            with open(EXPENSES_FILE, 'r') as f:
-                try:
-                    data = json.load(f)
-                except json.JSONDecodeError:
-                    return []
-        
-        needs_save = False
-        
-        for exp in data:
-            # 1. Ensure unique ID
-            if 'id' not in exp:
-                exp['id'] = str(uuid.uuid4())
-                needs_save = True
-                
-            # 2. Add 'type' key for old entries (Migration fix)
-            if 'type' not in exp:
-                exp['type'] = 'Expense' 
-                needs_save = True
-                
-        if needs_save:
-            self.expenses = data
-            self.save_expenses()
-            
-        return data
+        conn = _connect()
+        try:
+            if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                with conn:
+                    conn.execute("BEGIN") # The PRAGMA would otherwise run outside the transaction
+                    conn.executemany(_TX_UPSERT, [_tx_row(exp) for exp in _load_legacy_expenses()])
+                    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}") # PRAGMAs take no parameters
+            return [dict(zip(_TX_COLUMNS, row)) for row in conn.execute(_TX_SELECT)]
+        finally:
+            conn.close()
 
     def load_categories(self):
         """Load custom categories from file or use defaults."""
         if os.path.exists(CATEGORIES_FILE):
-            with open(CATEGORIES_FILE, 'r') as f:
-                return json.load(f)
+            return _read_json(CATEGORIES_FILE)
         return DEFAULT_CATEGORIES
     
-    def save_expenses(self):
-        """Save expenses to file"""
-        with open(EXPENSES_FILE, 'w') as f:
-            json.dump(self.expenses, f, indent=2)
+    def _save_transaction(self, expense):
+        """Queue an insert (or replacement, after an edit) of one transaction in the database."""
+        self._queue_write(('put', _tx_row(expense)))
+
+    def _delete_transaction(self, trans_id):
+        """Queue the removal of one transaction from the database."""
+        self._queue_write(('del', trans_id))
+
+    def _queue_write(self, job):
+        """Hand one change to the writer thread and watch for its result."""
+        self._write_q.put(job)
+        self._writes_pending += 1
+        if not self._write_poll_pending:
+            self._write_poll_pending = True
+            self.after(WRITE_POLL_MS, self._poll_writes)
+
+    def _poll_writes(self):
+        """Collect the writer thread's results on the Tk thread and report failed saves."""
+        self._write_poll_pending = False
+        error = None
+        while True:
+            try:
+                count, exc = self._write_results.get_nowait()
+            except queue.Empty:
+                break
+            self._writes_pending -= count
+            error = exc or error
+        
+        if error is not None:
+            self.update_status_indicator(False)
+            messagebox.showerror("Save Failed", f"Recent changes could not be saved to {EXPENSES_DB}:\n{error}\n\n"
+                                                "They will be missing the next time the app starts.")
+        if self._writes_pending > 0:
+            self._write_poll_pending = True
+            self.after(WRITE_POLL_MS, self._poll_writes)
+
+    def _run_writer(self):
+        """Writer thread: apply queued changes in order, committing whatever queued up meanwhile at once."""
+        conn = None
+        while True:
+            jobs = [self._write_q.get()]
+            while True:
+                try:
+                    jobs.append(self._write_q.get_nowait())
+                except queue.Empty:
+                    break
+            failed = None
+            try:
+                if conn is None:
+                    conn = _connect() # Connections can't be shared across threads
+                with conn: # One transaction (and one sync) per batch
+                    for job in jobs:
+                        if job is None:
+                            continue # Shutdown marker, handled below
+                        op, arg = job
+                        if op == 'put':
+                            conn.execute(_TX_UPSERT, arg)
+                        else:
+                            conn.execute(_TX_DELETE, (arg,))
+                if None in jobs:
+                    conn.close() # Before task_done, so on_close's join() covers it
+            except Exception as exc: # Not just sqlite3.Error: an uncaught error would kill the writer and hang on_close
+                traceback.print_exc() # Keep the writer alive for later changes
+                failed = exc # The whole batch was rolled back
+            finally:
+                self._write_results.put((sum(job is not None for job in jobs), failed))
+                for _ in jobs:
+                    self._write_q.task_done()
+            if None in jobs:
+                return
 
     def save_categories(self):
         """Save custom categories to file"""
-        with open(CATEGORIES_FILE, 'w') as f:
-            json.dump(self.categories, f, indent=2)
+        _atomic_write(CATEGORIES_FILE, _dump_json(self.categories))
+
+    def on_close(self):
+        """Let the writer thread commit queued changes and close the database before closing."""
+        self._write_q.put(None)
+        self._write_q.join()
+        self._poll_writes() # Report a failed last save before the window goes
+        self.destroy()
 
     # --- UI Creation ---
 
@@ -102,7 +419,7 @@ class FinancialTracker(ctk.CTk):
         ctk.CTkLabel(header_frame, text="💰 Financial Tracker Dashboard", font=self.font_main).grid(row=0, column=0, sticky="w")
         
         # Live Status Indicator
-        self.status_dot = ctk.CTkLabel(header_frame, text=" • ", font=ctk.CTkFont(size=30), text_color="red")
+        self.status_dot = ctk.CTkLabel(header_frame, text=" • ", font=self.font_dot, text_color="red")
         self.status_dot.grid(row=0, column=1, padx=5, sticky="e")
         ctk.CTkLabel(header_frame, text="Status: Connected", font=self.font_label).grid(row=0, column=2, padx=10, sticky="e")
         self.update_status_indicator(True) # Set initial status
@@ -152,18 +469,19 @@ class FinancialTracker(ctk.CTk):
             ctk.CTkLabel(grid_frame, text=label_text, font=self.font_label).grid(row=i, column=0, padx=10, pady=5, sticky="w")
             
             if key == "category":
-                self.category_entry = ctk.CTkComboBox(grid_frame, values=[c.capitalize() for c in self.categories], 
+                self.category_entry = ctk.CTkComboBox(grid_frame, values=self._cap_categories, 
                                                       command=self.category_selected, width=200)
                 self.category_entry.grid(row=i, column=1, padx=10, pady=5, sticky="ew")
                 # Set a default value if categories exist
                 if self.categories:
-                    self.category_entry.set(self.categories[0].capitalize()) 
+                    self.category_entry.set(self._cap_categories[0]) 
             else:
-                entry = ctk.CTkEntry(grid_frame, width=200)
-                entry.grid(row=i, column=1, padx=10, pady=5, sticky="ew")
-                setattr(self, f"{key}_entry", entry)
+                # Read and cleared through the variable: one Tk call instead of delete + insert
+                var = ctk.StringVar()
+                ctk.CTkEntry(grid_frame, width=200, textvariable=var).grid(row=i, column=1, padx=10, pady=5, sticky="ew")
+                setattr(self, f"{key}_var", var)
 
-        self.date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        self.date_var.set(date.today().isoformat())
 
         # Transaction Type (Radio Buttons)
         self.type_var = ctk.StringVar(value="Expense")
@@ -176,9 +494,11 @@ class FinancialTracker(ctk.CTk):
         ctk.CTkRadioButton(type_frame, text="Income", variable=self.type_var, value="Income", border_color="#4CAF50").pack(side="left", padx=15)
         
         # Action Button (Custom button with hover effect)
-        ctk.CTkButton(master, text="✨ ADD TRANSACTION", font=self.font_main, 
-                      command=self.add_transaction, hover_color="#388E3C", 
-                      fg_color="#4CAF50", height=40).pack(pady=10, padx=20, fill="x")
+        # Disabled until the transactions are loaded, so nothing is added to a list about to be replaced
+        self.add_btn = ctk.CTkButton(master, text="✨ ADD TRANSACTION", font=self.font_main, 
+                                     command=self.add_transaction, hover_color="#388E3C", 
+                                     fg_color="#4CAF50", height=40, state="disabled")
+        self.add_btn.pack(pady=10, padx=20, fill="x")
 
     def _create_summary_stats(self, master):
         """Creates the large stat boxes for the Summary Card."""
@@ -196,9 +516,19 @@ class FinancialTracker(ctk.CTk):
         # Total Expense Stat Box
         self.expense_box = self._create_stat_box(stats_frame, "Total Expenses 📉", "$0.00", 1, 0, "#f44336")
         
-        # Summary text area (for breakdown)
+        # Summary text area (for breakdown); a plain label stands in until there are expenses
         ctk.CTkLabel(stats_frame, text="Category Breakdown:", font=self.font_label).grid(row=2, column=0, columnspan=2, sticky="w", padx=5, pady=(10, 0))
-        self.summary_text = ctk.CTkTextbox(stats_frame, height=100, font=ctk.CTkFont(family="Segoe UI", size=10))
+        self._stats_frame = stats_frame
+        self.summary_text = None # Created by _ensure_summary_text
+        self._summary_placeholder = ctk.CTkLabel(stats_frame, text=" (No expenses recorded.)", font=self.font_small, anchor="w")
+        self._summary_placeholder.grid(row=3, column=0, columnspan=2, padx=5, pady=(5, 10), sticky="ew")
+
+    def _ensure_summary_text(self):
+        """Create the breakdown textbox in place of the empty-state label, the first time it is needed."""
+        if self.summary_text is not None:
+            return
+        self._summary_placeholder.destroy()
+        self.summary_text = ctk.CTkTextbox(self._stats_frame, height=100, font=self.font_small)
         self.summary_text.grid(row=3, column=0, columnspan=2, padx=5, pady=(5, 10), sticky="ew")
         self.summary_text.configure(state="disabled") # Make it read-only
 
@@ -221,12 +551,12 @@ class FinancialTracker(ctk.CTk):
         
         ctk.CTkLabel(filter_frame, text="🔎 Filter By:", font=self.font_label).pack(side="left", padx=(5, 10))
         
-        # Category Filter
+        # Category Filter (disabled until loaded, like the other controls)
         self.filter_category_var = ctk.StringVar(value="All Categories")
-        filter_categories = ["All Categories"] + [c.capitalize() for c in self.categories]
+        filter_categories = ["All Categories", *self._cap_categories]
         self.filter_category_combo = ctk.CTkComboBox(filter_frame, variable=self.filter_category_var, 
                                                      values=filter_categories, font=self.font_label, 
-                                                     command=self.filter_expenses, width=150)
+                                                     command=self.filter_expenses, width=150, state="disabled")
         self.filter_category_combo.pack(side="left", padx=10)
 
         # Type Filter
@@ -234,7 +564,7 @@ class FinancialTracker(ctk.CTk):
         filter_types = ["All Types", "Expense", "Income"]
         self.filter_type_combo = ctk.CTkComboBox(filter_frame, variable=self.filter_type_var, 
                                                  values=filter_types, font=self.font_label, 
-                                                 command=self.filter_expenses, width=120)
+                                                 command=self.filter_expenses, width=120, state="disabled")
         self.filter_type_combo.pack(side="left", padx=10)
 
     def _create_transaction_treeview(self, master):
@@ -255,17 +585,16 @@ class FinancialTracker(ctk.CTk):
                         font=self.font_label)
 
         # --- 2. Create the Treeview using standard ttk ---
-        columns = ("ID", "Type", "Date", "Amount", "Category", "Description")
+        # Rows use the transaction ID as their iid, so it needs no column of its own
+        columns = ("Type", "Date", "Amount", "Category", "Description")
         self.tree = ttk.Treeview(master, columns=columns, show="headings", style="Treeview")
         
-        self.tree.heading("ID", text="ID")
         self.tree.heading("Type", text="Type")
         self.tree.heading("Date", text="Date")
         self.tree.heading("Amount", text="Amount ($)")
         self.tree.heading("Category", text="Category")
         self.tree.heading("Description", text="Description")
         
-        self.tree.column("ID", width=0, stretch=False)
         self.tree.column("Type", width=70, anchor=ctk.CENTER)
         self.tree.column("Date", width=120, anchor=ctk.CENTER)
         self.tree.column("Amount", width=100, anchor=ctk.E)
@@ -273,24 +602,30 @@ class FinancialTracker(ctk.CTk):
         self.tree.column("Description", width=350, anchor=ctk.W)
         
         # Add scrollbar using CTkScrollbar
-        scrollbar = ctk.CTkScrollbar(master, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-        
+        self.tree_scrollbar = ctk.CTkScrollbar(master, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self._on_tree_yview)
+
         # Grid placement
         self.tree.grid(row=2, column=0, columnspan=2, padx=(10, 0), pady=10, sticky="nsew")
-        scrollbar.grid(row=2, column=2, padx=(0, 10), pady=10, sticky="ns") 
+        self.tree_scrollbar.grid(row=2, column=2, padx=(0, 10), pady=10, sticky="ns")
 
         self.tree.bind('<<TreeviewSelect>>', self.on_tree_select)
         self.tree.bind('<Double-1>', self.open_edit_window) 
         
-        # Bind for smooth scrolling
-        self.tree.bind_all("<MouseWheel>", self._on_mouse_wheel)
+        # Bind for smooth scrolling (on the tree only, so other widgets keep their wheel events)
+        self.tree.bind("<MouseWheel>", self._on_mouse_wheel)
 
     def _on_mouse_wheel(self, event):
         """Enables smooth mouse wheel scrolling for the Treeview."""
-        if event.widget == self.tree:
-            self.tree.yview_scroll(int(-1*(event.delta/120)), "units")
-            return "break"
+        self.tree.yview_scroll(int(-1*(event.delta/120)), "units")
+        return "break"
+
+    def _on_tree_yview(self, first, last):
+        """Syncs the scrollbar and renders more rows once the view nears the last rendered row."""
+        self.tree_scrollbar.set(first, last)
+        if float(last) > 0.9 and self._rendered_count < len(self._sorted_view) and not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._render_more)
 
     def _create_action_buttons(self, master):
         """Creates the action buttons (Edit, Delete, Manage Categories)."""
@@ -304,26 +639,30 @@ class FinancialTracker(ctk.CTk):
                                       fg_color="#FF9800", state="disabled")
         self.edit_btn.grid(row=0, column=0, padx=10, sticky="ew")
 
-        ctk.CTkButton(action_frame, text="❌ Delete Selected", font=self.font_label,
-                      command=self.delete_expense, hover_color="#B71C1C", 
-                      fg_color="#f44336").grid(row=0, column=1, padx=10, sticky="ew")
+        # Disabled until loaded, so the loading row is never "deleted"
+        self.delete_btn = ctk.CTkButton(action_frame, text="❌ Delete Selected", font=self.font_label,
+                                        command=self.delete_expense, hover_color="#B71C1C", 
+                                        fg_color="#f44336", state="disabled")
+        self.delete_btn.grid(row=0, column=1, padx=10, sticky="ew")
         
-        ctk.CTkButton(action_frame, text="⚙️ Manage Categories", font=self.font_label,
-                      command=self.open_category_manager, hover_color="#455A64", 
-                      fg_color="#607D8B").grid(row=0, column=2, padx=10, sticky="ew")
+        # Disabled until loaded: category removal checks usage counts
+        self.manage_btn = ctk.CTkButton(action_frame, text="⚙️ Manage Categories", font=self.font_label,
+                                        command=self.open_category_manager, hover_color="#455A64", 
+                                        fg_color="#607D8B", state="disabled")
+        self.manage_btn.grid(row=0, column=2, padx=10, sticky="ew")
 
     # --- Transaction Management Methods ---
 
     def add_transaction(self):
         """Add a new expense or income transaction."""
         try:
-            amount = float(self.amount_entry.get())
+            cents = _to_cents(self.amount_var.get())
             category = self.category_entry.get()
-            description = self.description_entry.get()
-            date_str = self.date_entry.get()
+            description = self.description_var.get()
+            date_str = self.date_var.get()
             trans_type = self.type_var.get()
 
-            if amount <= 0:
+            if cents <= 0:
                 messagebox.showwarning("Invalid Amount", "Amount must be positive.")
                 return
 
@@ -331,9 +670,7 @@ class FinancialTracker(ctk.CTk):
                 messagebox.showwarning("Missing Info", "Please select a category and enter a description.")
                 return
             
-            try:
-                datetime.strptime(date_str, "%Y-%m-%d")
-            except ValueError:
+            if not _is_valid_date(date_str):
                 messagebox.showerror("Invalid Date", "Please enter date in YYYY-MM-DD format.")
                 return
             
@@ -342,28 +679,31 @@ class FinancialTracker(ctk.CTk):
             transaction = {
                 "id": unique_id,
                 "type": trans_type,
-                "amount": amount,
+                "cents": cents,
                 "category": category.lower(),
                 "description": description,
                 "date": date_str
             }
             
-            self.expenses.append(transaction)
-            self.save_expenses()
+            _add_display_fields(transaction)
+            self.expenses.insert(_insert_position(self.expenses, transaction['_day']), transaction)
+            self._by_id[unique_id] = transaction
+            self._index_add(transaction)
+            self._apply_to_totals(transaction, 1)
+            self._save_transaction(transaction)
             
             # Clear entries
-            self.amount_entry.delete(0, ctk.END)
+            self.amount_var.set("")
             # self.category_entry.set(self.category_entry.get()) # Keep selected category for quick entry
-            self.description_entry.delete(0, ctk.END)
-            self.date_entry.delete(0, ctk.END)
-            self.date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
-            
-            self.refresh_expense_list()
+            self.description_var.set("")
+            self.date_var.set(date.today().isoformat())
+
+            self._show_transaction(transaction)
             self.update_summary()
             
-            messagebox.showinfo("Success", f"'{trans_type}' of ${amount:.2f} added!")
+            messagebox.showinfo("Success", f"'{trans_type}' of {_format_cents(cents)} added!")
             
-        except ValueError:
+        except (ValueError, OverflowError): # Not a number, or inf
             messagebox.showerror("Invalid Input", "Please enter a valid numeric amount.")
 
     def on_tree_select(self, event):
@@ -380,10 +720,9 @@ class FinancialTracker(ctk.CTk):
             messagebox.showwarning("No Selection", "Please select a transaction to edit.")
             return
 
-        item = self.tree.item(selected[0])
-        trans_id = item['values'][0]
+        trans_id = selected[0] # Row iid is the transaction ID
 
-        original_trans = next((exp for exp in self.expenses if exp['id'] == trans_id), None)
+        original_trans = self._by_id.get(trans_id)
         
         if not original_trans:
             messagebox.showerror("Error", "Transaction not found.")
@@ -404,8 +743,8 @@ class FinancialTracker(ctk.CTk):
             ctk.CTkLabel(edit_win, text=f"{field}:", font=self.font_label).grid(row=i+1, column=0, padx=10, pady=5, sticky="e")
             
             if field == "Category":
-                entry = ctk.CTkComboBox(edit_win, values=[c.capitalize() for c in self.categories], width=200)
-                entry.set(original_trans['category'].capitalize())
+                entry = ctk.CTkComboBox(edit_win, values=self._cap_categories, width=200)
+                entry.set(_display_category(original_trans['category']))
             elif field == "Type":
                 type_var = ctk.StringVar(value=original_trans['type'])
                 radio_frame = ctk.CTkFrame(edit_win, fg_color="transparent")
@@ -417,7 +756,7 @@ class FinancialTracker(ctk.CTk):
             else:
                 entry = ctk.CTkEntry(edit_win, width=200)
                 if field.lower() == 'amount':
-                    entry.insert(0, f"{original_trans[field.lower()]:.2f}")
+                    entry.insert(0, f"{original_trans['cents'] / 100:.2f}")
                 elif field.lower() == 'date':
                     entry.insert(0, original_trans[field.lower()]) 
                 else:
@@ -428,36 +767,42 @@ class FinancialTracker(ctk.CTk):
 
         def save_edit():
             try:
-                new_amount = float(entries['Amount'].get())
+                new_cents = _to_cents(entries['Amount'].get())
                 new_date = entries['Date'].get()
                 new_category = entries['Category'].get()
                 new_description = entries['Description'].get()
                 new_type = entries['Type'].get()
 
-                if new_amount <= 0:
+                if new_cents <= 0:
                     messagebox.showwarning("Invalid Amount", "Amount must be positive.")
                     return
 
-                try:
-                    datetime.strptime(new_date, "%Y-%m-%d")
-                except ValueError:
+                if not _is_valid_date(new_date):
                     messagebox.showerror("Invalid Date", "Date must be in YYYY-MM-DD format.")
                     return
 
-                # Update the original transaction object
-                original_trans['amount'] = new_amount
-                original_trans['date'] = new_date 
+                # Update the original transaction object and re-place its row
+                self._hide_transaction(original_trans)
+                self._apply_to_totals(original_trans, -1)
+                del self.expenses[_index_of(self.expenses, original_trans)]
+                self._index_remove(original_trans)
+                original_trans['cents'] = new_cents
+                original_trans['date'] = new_date
                 original_trans['category'] = new_category.lower()
                 original_trans['description'] = new_description
                 original_trans['type'] = new_type
+                _add_display_fields(original_trans)
+                self.expenses.insert(_insert_position(self.expenses, original_trans['_day']), original_trans)
+                self._index_add(original_trans)
+                self._show_transaction(original_trans)
+                self._apply_to_totals(original_trans, 1)
 
-                self.save_expenses()
-                self.refresh_expense_list()
+                self._save_transaction(original_trans)
                 self.update_summary()
                 edit_win.destroy()
                 messagebox.showinfo("Success", "Transaction updated successfully!")
 
-            except ValueError:
+            except (ValueError, OverflowError): # Not a number, or inf
                 messagebox.showerror("Invalid Input", "Please ensure Amount is a number.")
 
         ctk.CTkButton(edit_win, text="💾 Save Changes", command=save_edit, hover_color="#388E3C", fg_color="#4CAF50").grid(row=len(fields)+1, column=0, columnspan=2, pady=15)
@@ -471,15 +816,22 @@ class FinancialTracker(ctk.CTk):
             messagebox.showwarning("No Selection", "Please select a transaction to delete.")
             return
         
-        item = self.tree.item(selected[0])
-        trans_id = item["values"][0] 
+        trans_id = selected[0] # Row iid is the transaction ID
+        
+        expense = self._by_id.get(trans_id)
+        if not expense:
+            messagebox.showerror("Error", "Transaction not found.")
+            return
         
         if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this transaction?"):
-            
-            self.expenses[:] = [exp for exp in self.expenses if exp['id'] != trans_id]
-            
-            self.save_expenses()
-            self.refresh_expense_list()
+
+            del self._by_id[trans_id]
+            self._hide_transaction(expense)
+            self._apply_to_totals(expense, -1)
+            del self.expenses[_index_of(self.expenses, expense)]
+            self._index_remove(expense)
+            self._delete_transaction(trans_id)
+
             self.update_summary()
             self.edit_btn.configure(state="disabled")
             messagebox.showinfo("Deleted", "Transaction deleted successfully!")
@@ -487,74 +839,204 @@ class FinancialTracker(ctk.CTk):
     # --- Display & Filtering Methods ---
 
     def filter_expenses(self, choice):
-        """Filters the expenses list based on selected criteria."""
-        category_filter = self.filter_category_var.get().lower()
+        """Filters the expenses list based on selected criteria, starting from the per-category/type subsets."""
+        category_label = self.filter_category_var.get()
         type_filter = self.filter_type_var.get()
         
-        filtered_list = self.expenses
-        
-        if category_filter != "all categories":
-            filtered_list = [exp for exp in filtered_list if exp['category'] == category_filter]
+        # None means "don't filter on this"; also used by _matches_filters
+        # (the combobox is editable, so typed text falls back to its lowercase form)
+        self._category_filter = self._filter_category_keys.get(category_label, category_label.lower())
+        self._type_filter = type_filter if type_filter != "All Types" else None
         
-        if type_filter != "All Types":
-            filtered_list = [exp for exp in filtered_list if exp['type'] == type_filter]
+        cat, trans_type = self._category_filter, self._type_filter
+        if cat is None and trans_type is None:
+            filtered_list = self.expenses
+        elif trans_type is None:
+            filtered_list = self._by_category.get(cat, [])
+        elif cat is None:
+            filtered_list = self._by_type.get(trans_type, [])
+        else:
+            # Both filters: scan only the category's transactions (usually the smaller subset)
+            filtered_list = [exp for exp in self._by_category.get(cat, []) if exp['type'] == trans_type]
             
         self.refresh_expense_list(filtered_list)
 
     def refresh_expense_list(self, expense_list=None):
-        """Refresh the expense list display with the provided list (or all expenses)."""
-        
+        """
+        Refresh the expense list display with the provided list (or all expenses),
+        which must already be newest-first, as self.expenses and its filtered subsets are.
+        Only the first window of rows is rendered; the rest are rendered on scroll.
+        Rows already in the Treeview are kept, and rows leaving the view are detached
+        rather than deleted, so changing a filter back only reattaches them.
+        """
+
         data_to_display = expense_list if expense_list is not None else self.expenses
+        self._sorted_view = list(data_to_display)
+        window = self._sorted_view[:self._window_size()]
+
+        # Old and new views are both subsequences of self.expenses, so kept rows are already in order
+        shown = set(self.tree.get_children())
+        keep = {expense['id'] for expense in window}
+        stale = [iid for iid in shown if iid not in keep]
+        if stale:
+            self.tree.selection_remove(*stale) # As deleting them would
+            self.tree.detach(*stale)
+            self._detached.update(stale)
+        for index, expense in enumerate(window):
+            if expense['id'] not in shown:
+                self._insert_tree_row(index, expense)
+        self._rendered_count = len(window)
+
+    def _render_more(self):
+        """Insert the next window of not-yet-rendered rows at the end of the Treeview."""
+        self._render_pending = False
+        end = min(self._rendered_count + self._window_size(), len(self._sorted_view))
+
+        for expense in self._sorted_view[self._rendered_count:end]:
+            self._insert_tree_row(ctk.END, expense)
+        self._rendered_count = end
+
+    def _window_size(self):
+        """Number of rows to render per batch: the visible rows plus a scroll buffer."""
+        return self.tree.winfo_height() // TREE_ROW_HEIGHT + RENDER_BUFFER
+
+    def _insert_tree_row(self, index, expense):
+        """Insert a single transaction row, using its ID as the Treeview item ID."""
+        if expense["id"] in self._detached:
+            self._detached.remove(expense["id"])
+            self.tree.move(expense["id"], "", index) # Reattach; cheaper than a fresh insert
+        else:
+            self.tree.insert("", index, iid=expense["id"], values=expense["_row"])
+
+    def _index_add(self, expense):
+        """Add a transaction to its category and type subsets, keeping them newest-first."""
+        for seq in (self._by_category[expense['category']], self._by_type[expense['type']]):
+            seq.insert(_insert_position(seq, expense['_day']), expense)
+
+    def _index_remove(self, expense):
+        """Remove a transaction from its category and type subsets."""
+        for seq in (self._by_category[expense['category']], self._by_type[expense['type']]):
+            del seq[_index_of(seq, expense)]
+
+    def _matches_filters(self, expense):
+        """True if the transaction passes the active category and type filters."""
+        return ((self._category_filter is None or expense['category'] == self._category_filter)
+                and (self._type_filter is None or expense['type'] == self._type_filter))
+
+    def _show_transaction(self, expense):
+        """Add one transaction to the displayed list without re-rendering the other rows."""
+        if not self._matches_filters(expense):
+            return
+
+        index = _insert_position(self._sorted_view, expense['_day'])
+        self._sorted_view.insert(index, expense)
+
+        # Rows past the rendered window are left for _render_more to pick up on scroll
+        if index < self._rendered_count or self._rendered_count == len(self._sorted_view) - 1:
+            self._insert_tree_row(index, expense)
+            self._rendered_count += 1
+
+    def _hide_transaction(self, expense):
+        """Remove one transaction from the displayed list without re-rendering the other rows."""
+        if expense['id'] in self._detached:
+            # A detached row would be reattached with stale values after an edit
+            self._detached.remove(expense['id'])
+            self.tree.delete(expense['id'])
+        
+        try:
+            del self._sorted_view[_index_of(self._sorted_view, expense)]
+        except ValueError:
+            return # Filtered out, so not displayed
+
+        if self.tree.exists(expense['id']):
+            self.tree.delete(expense['id'])
+            self._rendered_count -= 1
+
+    def _recompute_totals(self):
+        """Rebuild the running income/expense and per-category totals in a single pass."""
+        total_income = total_expense = 0 # All in integer cents, so sums are exact
+        cat_totals = defaultdict(int) # Expense totals per category
+        used_categories = Counter() # Transactions per category, of either type
         
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # One fused loop over local names (no per-row attribute lookups)
+        for exp in self.expenses:
+            amount = exp['cents']
+            used_categories[exp['category']] += 1
+            if exp['type'] == 'Income':
+                total_income += amount
+            elif exp['type'] == 'Expense':
+                total_expense += amount
+                cat_totals[exp['category']] += amount
         
-        data_to_display.sort(key=lambda x: x['date'], reverse=True)
+        self._totals = {'Income': total_income, 'Expense': total_expense}
+        self._cat_totals = cat_totals
+        self._used_categories = used_categories
+
+    def _apply_to_totals(self, expense, sign):
+        """Add (sign=1) or subtract (sign=-1) one transaction from the running totals and usage counts."""
+        self._used_categories[expense['category']] += sign
+        amount = sign * expense['cents']
+        trans_type = expense['type']
+        if trans_type in self._totals:
+            self._totals[trans_type] += amount
         
-        for expense in data_to_display:
-            trans_type = expense["type"]
-            amount_display = f"${expense['amount']:,.2f}"
-            
-            self.tree.insert("", ctk.END, values=(
-                expense["id"],
-                trans_type,
-                expense["date"],
-                amount_display,
-                expense["category"].capitalize(),
-                expense["description"]
-            ))
-            
+        if trans_type == 'Expense':
+            category = expense['category']
+            self._cat_totals[category] += amount
+            if not self._cat_totals[category]:
+                del self._cat_totals[category]
+
     def update_summary(self):
-        """Update summary statistics including income, expense, and net balance."""
+        """
+        Update summary statistics from the running totals (no pass over the transactions).
+        The stat boxes and category breakdown are updated once Tk is idle, so a burst
+        of changes redraws them once.
+        """
+        if not self._summary_pending:
+            self._summary_pending = True
+            self.after_idle(self._update_totals)
+
+    def _update_totals(self):
+        """Update the income, expense and net balance stat boxes, and the category breakdown."""
+        self._summary_pending = False
         
-        total_income = sum(exp['amount'] for exp in self.expenses if exp['type'] == 'Income')
-        total_expense = sum(exp['amount'] for exp in self.expenses if exp['type'] == 'Expense')
+        total_income = self._totals['Income']
+        total_expense = self._totals['Expense']
         net_balance = total_income - total_expense
-    
-        expense_categories = defaultdict(float)
-        for exp in self.expenses:
-            if exp['type'] == 'Expense':
-                expense_categories[exp['category']] += exp['amount']
-        
-        # Build category breakdown text
-        category_text = ""
-        if total_expense > 0:
-            for cat, amount in sorted(expense_categories.items(), key=lambda x: x[1], reverse=True):
-                percentage = (amount / total_expense) * 100
-                category_text += f" • {cat.capitalize()}: ${amount:,.2f} ({percentage:.1f}%)\n"
-        else:
-            category_text = " (No expenses recorded.)"
         
         # Update Stat Boxes
-        self.income_box.configure(text=f"${total_income:,.2f}")
-        self.expense_box.configure(text=f"${total_expense:,.2f}")
-        self.net_balance_box.configure(text=f"${net_balance:,.2f}")
+        self.income_box.configure(text=_format_cents(total_income))
+        self.expense_box.configure(text=_format_cents(total_expense))
+        self.net_balance_box.configure(text=_format_cents(net_balance))
         
         # Color-coded status for Net Balance
         net_color = "#4CAF50" if net_balance >= 0 else "#f44336"
         self.net_balance_box.master.configure(fg_color=net_color)
+        self._update_breakdown()
+
+    def _update_breakdown(self):
+        """Rebuild the category breakdown text from the per-category totals."""
+        total_expense = self._totals['Expense']
+        if total_expense <= 0 and self.summary_text is None:
+            return # The empty-state label already says so
+        
+        # Build category breakdown text as lines, joined once
+        if total_expense > 0:
+            top = heapq.nlargest(BREAKDOWN_TOP_N, self._cat_totals.items(), key=itemgetter(1))
+            lines = [f" • {_display_category(cat)}: {_format_cents(amount)} ({amount / total_expense * 100:.1f}%)\n"
+                     for cat, amount in top]
+            
+            # Fold the long tail into one line
+            rest = len(self._cat_totals) - len(top)
+            if rest > 0:
+                amount = total_expense - sum(amount for _, amount in top)
+                lines.append(f" • {rest} more: {_format_cents(amount)} ({amount / total_expense * 100:.1f}%)\n")
+            category_text = "".join(lines)
+        else:
+            category_text = " (No expenses recorded.)"
 
         # Update Text Box for Breakdown
+        self._ensure_summary_text()
         self.summary_text.configure(state="normal")
         self.summary_text.delete("1.0", "end")
         self.summary_text.insert("1.0", category_text)
@@ -586,14 +1068,14 @@ class FinancialTracker(ctk.CTk):
 
         def add_category():
             new_cat = new_cat_entry.get().strip().lower()
-            if new_cat and new_cat.capitalize() not in self.categories:
+            if new_cat and new_cat not in self._cats_lower:
                 self.categories.append(new_cat.capitalize())
                 self.categories.sort()
                 self.save_categories()
-                tk_listbox.delete(0, tk.END)
-                for cat in self.categories:
-                    tk_listbox.insert(ctk.END, cat.capitalize())
                 self.update_category_comboboxes()
+                tk_listbox.delete(0, tk.END)
+                for cat in self._cap_categories:
+                    tk_listbox.insert(ctk.END, cat)
                 new_cat_entry.delete(0, ctk.END)
                 messagebox.showinfo("Success", f"Category '{new_cat.capitalize()}' added.")
             elif new_cat:
@@ -611,8 +1093,8 @@ class FinancialTracker(ctk.CTk):
         tk_listbox = tk.Listbox(category_list_frame, width=40, height=10, bg="#2B2B2B", fg="white", selectbackground="#347083", highlightthickness=0)
         tk_listbox.pack(padx=5, pady=5)
         
-        for cat in self.categories:
-            tk_listbox.insert(ctk.END, cat.capitalize())
+        for cat in self._cap_categories:
+            tk_listbox.insert(ctk.END, cat)
 
         def remove_category():
             selected_indices = tk_listbox.curselection()
@@ -625,7 +1107,7 @@ class FinancialTracker(ctk.CTk):
             cat_to_remove_lower = cat_to_remove_display.lower()
 
             # Check if category is in use
-            if any(exp['category'] == cat_to_remove_lower for exp in self.expenses):
+            if self._used_categories.get(cat_to_remove_lower, 0) > 0:
                  messagebox.showwarning("In Use", f"Cannot remove '{cat_to_remove_display}'. Update or delete related transactions first.")
                  return
 
@@ -639,13 +1121,18 @@ class FinancialTracker(ctk.CTk):
         ctk.CTkButton(cat_win, text="❌ Remove Selected Category", command=remove_category, hover_color="#B71C1C", fg_color="#f44336").pack(pady=10)
         cat_win.wait_window()
 
+    def _set_display_categories(self):
+        """Rebuild the display form of the categories, the filter's label -> stored key map and the name set."""
+        self._cap_categories = [_display_category(c) for c in self.categories]
+        self._cats_lower = {c.lower() for c in self.categories} # O(1) duplicate check when adding
+        self._filter_category_keys = {"All Categories": None} # None means "don't filter"
+        self._filter_category_keys.update((label, label.lower()) for label in self._cap_categories)
+
     def update_category_comboboxes(self):
-        """Updates the values in all category comboboxes."""
-        display_categories = [c.capitalize() for c in self.categories]
-        self.category_entry.configure(values=display_categories)
-        
-        filter_categories = ["All Categories"] + display_categories
-        self.filter_category_combo.configure(values=filter_categories)
+        """Rebuilds the cached display categories and updates all category comboboxes."""
+        self._set_display_categories()
+        self.category_entry.configure(values=self._cap_categories)
+        self.filter_category_combo.configure(values=["All Categories", *self._cap_categories])
 
     def category_selected(self, choice):
         """Required command function for CTkComboBox."""